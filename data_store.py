@@ -0,0 +1,130 @@
+"""
+Data Store – Smart Fitness Management System
+
+Shared helpers for reading and writing the app's JSON data files.
+Uses orjson when it is installed and falls back to the standard
+json module otherwise, so every screen parses and serializes the
+same way.
+"""
+
+import json
+import mmap
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files at least this large are parsed straight from a read-only memory map
+MMAP_THRESHOLD = 64 * 1024
+
+# How often the Tk loop checks whether background file work has finished
+POLL_MS = 20
+
+# Single background worker for file I/O; one thread keeps reads and writes
+# of the same file in order, even across several open windows
+io_pool = ThreadPoolExecutor(max_workers=1)
+
+# Cached (whole second, "YYYY-MM-DD") pair for the date stamp on new records
+_today_cache = [None, None]
+
+
+def loads(data):
+    """
+    Parse JSON from bytes or str.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj):
+    """
+    Serialize an object to compact JSON bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def today_str():
+    """
+    Return today's date as YYYY-MM-DD, formatting it at most once a second.
+    """
+    now = int(time.time())
+    if _today_cache[0] != now:
+        _today_cache[:] = [now, date.today().isoformat()]
+    return _today_cache[1]
+
+
+def read_json(path):
+    """
+    Load and parse a whole JSON file.
+    """
+    with open(path, "rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            # orjson can parse the mapped pages without an intermediate bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return loads(f.read())
+
+
+def write_json(path, obj):
+    """
+    Serialize an object and atomically replace a JSON file with it.
+    The data goes to a temp file that is synced to disk before the
+    rename, so neither a crash nor a power loss leaves a half-written
+    or empty file behind.
+    """
+    # Encode first, so a serialization error never leaves a temp file behind
+    # and the payload goes out in a single write call
+    write_bytes(path, dumps(obj))
+
+
+def write_bytes(path, payload):
+    """
+    Atomically replace a file with the given bytes, via a temp file.
+    """
+    # Per-process temp name, so two running copies of the app never share one
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        # Without this, some filesystems can commit the rename before the
+        # data, leaving an empty file after an OS crash
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def ensure_file(path, default):
+    """
+    Create a JSON data file (and its folder) holding default if it is missing.
+    """
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        write_json(path, default)
+
+
+def call_when_done(widget, future, callback=None, on_error=None):
+    """
+    Hand a background future's result to callback on the Tk thread.
+
+    The future is polled from the widget's event loop, so worker threads
+    never touch Tk themselves. If the work failed and on_error is given,
+    it gets the exception instead. Nothing is called once the widget is gone.
+    """
+    def poll():
+        if not widget.winfo_exists():
+            return
+        if not future.done():
+            widget.after(POLL_MS, poll)
+        elif on_error is not None and future.exception() is not None:
+            on_error(future.exception())
+        elif callback is not None:
+            callback(future.result())
+    poll()
+
@@ -14,21 +14,17 @@ Date: [YYYY-MM-DD]
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import json
 import os
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import date
 from tkinter.font import nametofont
+from data_store import call_when_done, io_pool, read_json, write_json
+from ui_helpers import digits_only, show_toast
+from workouts import clear_workouts, daily_calories, workout_listeners, workouts_version
 
-# File paths for storing goals and workout data
+# File path for storing the goal
+# (created on first write; a missing file simply means no goal yet)
 GOALS_FILE = "data/goals.json"
-WORKOUTS_FILE = "data/workouts.json"
-
-# Ensure the necessary files and folders exist
-os.makedirs("data", exist_ok=True)
-for path in [GOALS_FILE, WORKOUTS_FILE]:
-    if not os.path.exists(path):
-        with open(path, "w") as f:
-            json.dump([], f) if "workouts" in path else json.dump({}, f)
 
 class GoalScreen:
     """
@@ -60,7 +56,8 @@ class GoalScreen:
         goal_frame.pack()
 
         ttk.Label(goal_frame, text="Enter Calorie Goal:").grid(row=0, column=0, sticky="e", padx=5, pady=5)
-        self.goal_entry = ttk.Entry(goal_frame, width=30)
+        vcmd = digits_only(self.window)
+        self.goal_entry = ttk.Entry(goal_frame, width=30, validate="key", validatecommand=vcmd)
         self.goal_entry.grid(row=0, column=1, padx=5, pady=5)
 
         ttk.Button(goal_frame, text="Set Goal", command=self.set_goal).grid(row=1, column=1, sticky="e", pady=10)
@@ -81,6 +78,23 @@ class GoalScreen:
         ttk.Button(progress_frame, text="Refresh Progress", command=self.update_progress).pack(pady=5)
         ttk.Button(progress_frame, text="View Weekly Report", command=self.show_report).pack(pady=5)
 
+        # Parsed goal file, reloaded only when the file's mtime changes
+        self._goal_cache = None
+        self._goal_mtime = None
+
+        # Running calorie aggregates, rebuilt from the database only when
+        # workouts_version() says the workouts changed since
+        self._totals_version = None
+        self._total_burned = 0
+        self._daily_totals = defaultdict(int)
+
+        # Last (percent, burned, goal) shown, to skip redundant redraws
+        self._last_render = None
+
+        # Keep aggregates current as workouts are logged from the workout screen
+        workout_listeners.append(self.on_workout_logged)
+        self.window.bind("<Destroy>", self.on_destroy)
+
         # Load previous goal if exists and update progress
         self.load_existing_goal()
         self.update_progress()
@@ -89,47 +103,56 @@ class GoalScreen:
         """
         Save the calorie goal entered by the user.
         """
-        try:
-            goal = int(self.goal_entry.get())
-            if goal <= 0:
-                raise ValueError
-        except ValueError:
+        # The entry only accepts digits, so a non-empty value always parses
+        text = self.goal_entry.get()
+        goal = int(text) if text else 0
+        if goal <= 0:
             messagebox.showerror("Invalid", "Please enter a valid positive number.")
             return
 
-        with open(GOALS_FILE, "w") as f:
-            json.dump({"calorie_goal": goal}, f)
+        os.makedirs("data", exist_ok=True)
+        write_json(GOALS_FILE, {"calorie_goal": goal})
+        self._goal_mtime = None
 
-        messagebox.showinfo("Saved", f"Goal of {goal} calories set.")
+        show_toast(self.window, f"Goal of {goal} calories set.")
         self.update_progress()
 
     def load_existing_goal(self):
         """
         Load any previously saved goal into the input field.
         """
-        with open(GOALS_FILE, "r") as f:
-            data = json.load(f)
-            goal = data.get("calorie_goal")
-            if goal:
-                self.goal_entry.delete(0, tk.END)
-                self.goal_entry.insert(0, str(goal))
+        try:
+            data = read_json(GOALS_FILE)
+        except FileNotFoundError:
+            data = {}
+
+        goal = data.get("calorie_goal")
+        if goal:
+            self.goal_entry.delete(0, tk.END)
+            self.goal_entry.insert(0, str(goal))
 
     def update_progress(self):
         """
         Update the progress bar based on calories burned from workouts.
         """
-        with open(GOALS_FILE, "r") as f:
-            goal_data = json.load(f)
-            goal = goal_data.get("calorie_goal", 0)
+        goal_data = self._load_json_cached(GOALS_FILE, "_goal_cache", "_goal_mtime", {})
+        goal = goal_data.get("calorie_goal", 0)
+
+        self.refresh_totals(lambda: self.render_progress(goal))
 
-        with open(WORKOUTS_FILE, "r") as f:
-            workouts = json.load(f)
-            total_burned = sum(w.get("calories", 0) for w in workouts)
+    def render_progress(self, goal):
+        """
+        Show the current totals against the goal, offering a reset once it is reached.
+        """
+        total_burned = self._total_burned
+        progress = 0 if not goal else min(100.0, total_burned * (100.0 / goal))
 
-        progress = min(100, (total_burned / goal) * 100 if goal else 0)
-        self.progress_var.set(progress)
-        self.progress_bar.configure(value=progress)
-        self.progress_label.config(text=f"{int(progress)}% completed ({total_burned} of {goal} cal)")
+        # The bar follows progress_var; skip the Tk calls if nothing changed
+        render = (int(progress), total_burned, goal)
+        if render != self._last_render:
+            self.progress_var.set(progress)
+            self.progress_label.config(text=f"{int(progress)}% completed ({total_burned} of {goal} cal)")
+            self._last_render = render
 
         if progress >= 100:
             response = messagebox.askyesno(
@@ -139,45 +162,131 @@ class GoalScreen:
             if response:
                 self.reset_progress_and_goal()
 
+    def _load_json_cached(self, path, cache_attr, mtime_attr, default):
+        """
+        Return the parsed contents of a JSON file, re-reading it only
+        when its modification time differs from the cached one.
+        A missing file yields `default` (cached with an mtime of 0).
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = 0
+
+        if getattr(self, mtime_attr) != mtime:
+            if mtime:
+                setattr(self, cache_attr, read_json(path))
+            else:
+                setattr(self, cache_attr, default)
+            setattr(self, mtime_attr, mtime)
+        return getattr(self, cache_attr)
+
+    def refresh_totals(self, then):
+        """
+        Rebuild the calorie aggregates if the workouts changed since the
+        last build, then call `then` once they are current.
+        """
+        version = workouts_version()
+        if version == self._totals_version:
+            then()
+            return
+
+        def on_totals(totals):
+            # An older rebuild finishing late must not replace a newer one
+            if self._totals_version is None or version > self._totals_version:
+                daily = defaultdict(int, totals)
+                self._totals_version = version
+                self._total_burned = sum(daily.values())
+                self._daily_totals = daily
+            then()
+
+        # The query queues behind any pending workout changes on the I/O thread
+        call_when_done(self.window, io_pool.submit(daily_calories), on_totals, self.on_load_error)
+
+    def on_load_error(self, error):
+        """
+        Tell the user the workout history could not be read.
+        """
+        messagebox.showerror("Load Failed", f"Could not read workouts:\n{error}")
+
+    def on_workout_logged(self, workout, version):
+        """
+        Add a newly stored workout to the aggregates without a rescan.
+        """
+        # Nothing built yet, or the last rebuild already counted it
+        if self._totals_version is None or version <= self._totals_version:
+            return
+
+        calories = workout.get("calories", 0)
+        self._total_burned += calories
+        self._daily_totals[workout.get("date")] += calories
+
+        # Skip the next rebuild if this workout is the only change since the
+        # last one; otherwise leave the version stale so the totals reload
+        if version == self._totals_version + 1:
+            self._totals_version = version
+
+    def on_destroy(self, event):
+        """
+        Stop listening for new workouts once the window is closed.
+        """
+        if event.widget is self.window and self.on_workout_logged in workout_listeners:
+            workout_listeners.remove(self.on_workout_logged)
+
     def reset_progress_and_goal(self):
         """
         Clear the workout history and goal input to restart tracking.
         """
-        with open(WORKOUTS_FILE, "w") as f:
-            json.dump([], f)
+        future = clear_workouts()
+        version = workouts_version()
+        # Watched from the main window so a failure is still reported
+        # after this window has been closed
+        call_when_done(self.window.master, future, lambda result: self.on_workouts_cleared(version),
+                       self.on_clear_error)
+
+    def on_workouts_cleared(self, version):
+        """
+        Reset the progress display once the workout history is gone.
+        """
+        if not self.window.winfo_exists():
+            return
+
+        # Later changes still bump the version, so the next refresh sees them
+        self._totals_version = version
+        self._total_burned = 0
+        self._daily_totals = defaultdict(int)
 
         self.goal_entry.delete(0, tk.END)
         self.progress_var.set(0)
-        self.progress_bar.configure(value=0)
         self.progress_label.config(text="0% completed")
+        self._last_render = None
         self.window.after(100, lambda: self.goal_entry.focus())
 
         messagebox.showinfo("Reset", "Workout history cleared. Please enter a new goal to begin again.")
 
+    def on_clear_error(self, error):
+        """
+        Tell the user the workout history could not be cleared.
+        """
+        messagebox.showerror("Reset Failed", f"Could not clear workouts:\n{error}")
+
     def show_report(self):
         """
         Show a summary of calories burned for the past 7 days.
         """
-        try:
-            with open(WORKOUTS_FILE, "r") as f:
-                workouts = json.load(f)
-        except:
-            workouts = []
-
-        today = datetime.today()
-        days = [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(6, -1, -1)]
-        daily_summary = {day: 0 for day in days}
-
-        for w in workouts:
-            date = w.get("date")
-            if date in daily_summary:
-                daily_summary[date] += w.get("calories", 0)
+        self.refresh_totals(self.show_weekly_totals)
 
-        summary_text = "Weekly Calorie Burn Report:\n\n"
-        for day, cal in daily_summary.items():
-            summary_text += f"{day}: {cal} cal\n"
+    def show_weekly_totals(self):
+        """
+        Show the past 7 days from the current aggregates.
+        """
+        today = date.today().toordinal()
+        days = [date.fromordinal(today - i).isoformat() for i in range(6, -1, -1)]
+        daily_summary = {day: self._daily_totals.get(day, 0) for day in days}
 
-        total = sum(daily_summary.values())
-        summary_text += f"\n Total This Week: {total} cal"
+        parts = ["Weekly Calorie Burn Report:", ""]
+        parts.extend(f"{day}: {cal} cal" for day, cal in daily_summary.items())
+        parts.append("")
+        parts.append(f" Total This Week: {sum(daily_summary.values())} cal")
 
-        messagebox.showinfo("Weekly Report", summary_text)
+        messagebox.showinfo("Weekly Report", "\n".join(parts))
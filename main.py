@@ -15,15 +15,11 @@ Date: [YYYY-MM-DD]
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-
-# Import individual module screens
-from users import UserScreen
-from workouts import WorkoutScreen
-from goals import GoalScreen
-from nutrition import NutritionScreen
-from reports import ReportScreen
 from tkinter.font import nametofont
 
+# Module screens are imported inside their open_* methods so startup only
+# pays for the screens that are actually opened.
+
 class HomeScreen:
     """
     Main GUI window for the Smart Fitness Management System.
@@ -44,6 +40,13 @@ class HomeScreen:
         default_font = nametofont("TkDefaultFont")
         default_font.configure(family="Helvetica", size=11)
 
+        # Use the Sun Valley theme when it is installed
+        try:
+            import sv_ttk
+            sv_ttk.set_theme("dark")
+        except ImportError:
+            pass
+
         # Apply basic ttk styling
         style = ttk.Style()
         style.configure("TButton", font=("Helvetica", 11), padding=6)
@@ -83,30 +86,35 @@ class HomeScreen:
 
     def open_users(self):
         try:
+            from users import UserScreen
             UserScreen(self.root)
         except Exception as e:
             messagebox.showinfo("Error", str(e))
 
     def open_workouts(self):
         try:
+            from workouts import WorkoutScreen
             WorkoutScreen(self.root)
         except Exception as e:
             messagebox.showinfo("Error", str(e))
 
     def open_goals(self):
         try:
+            from goals import GoalScreen
             GoalScreen(self.root)
         except Exception as e:
             messagebox.showinfo("Error", str(e))
 
     def open_nutrition(self):
         try:
+            from nutrition import NutritionScreen
             NutritionScreen(self.root)
         except Exception as e:
             messagebox.showinfo("Error", str(e))
 
     def open_reports(self):
         try:
+            from reports import ReportScreen
             ReportScreen(self.root)
         except Exception as e:
             messagebox.showinfo("Error", str(e))
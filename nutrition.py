@@ -6,7 +6,7 @@ This module allows users to:
 - Display a table showing meal history
 - Provide simple nutrition tips based on most recent meal
 
-Data file used: data/meals.json
+Data file used: data/meals.jsonl (one JSON object per line)
 
 Author: Jawad Khan
 Date: [YYYY-MM-DD]
@@ -14,17 +14,98 @@ Date: [YYYY-MM-DD]
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import json
 import os
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from tkinter.font import nametofont
+from data_store import call_when_done, dumps, loads, read_json, today_str, write_bytes
+from ui_helpers import digits_only, show_toast
 
-# === Ensure meals data file exists ===
-DATA_FILE = "data/meals.json"
-os.makedirs("data", exist_ok=True)
-if not os.path.exists(DATA_FILE):
-    with open(DATA_FILE, "w") as f:
-        json.dump([], f)
+DATA_FILE = "data/meals.jsonl"
+LEGACY_DATA_FILE = "data/meals.json"
+
+# Every read and append of the meal file runs on this one worker, so a
+# read never sees a half-written line; it is separate from io_pool so the
+# report can read meals while the workout query runs
+meals_pool = ThreadPoolExecutor(max_workers=1)
+
+# Meals logged but not yet appended to disk, shared by all nutrition
+# windows so a report can flush them before reading
+_pending_meals = []
+
+
+def ensure_meals_file():
+    """
+    Create the JSONL data file on first use, converting the old single
+    JSON array file if there is one. The new file appears atomically and
+    the old one is only set aside afterwards, so a crash or a malformed
+    old file never loses meals.
+    """
+    if os.path.exists(DATA_FILE):
+        return
+    os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
+    legacy = os.path.exists(LEGACY_DATA_FILE)
+    legacy_meals = read_json(LEGACY_DATA_FILE) if legacy else []
+    write_bytes(DATA_FILE, b"".join(dumps(m) + b"\n" for m in legacy_meals))
+    if legacy:
+        os.replace(LEGACY_DATA_FILE, LEGACY_DATA_FILE + ".bak")
+
+
+def read_meals():
+    """
+    Read every logged meal from the JSONL data file.
+    """
+    ensure_meals_file()
+    meals = []
+    with open(DATA_FILE, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                meals.append(loads(line))
+            except ValueError:
+                # The remains of an interrupted append; the meals around it
+                # are still intact, so only this line is skipped
+                continue
+    return meals
+
+
+def append_meals(meals):
+    """
+    Append meals to the JSONL data file in one write.
+    """
+    ensure_meals_file()
+    payload = b"".join(dumps(m) + b"\n" for m in meals)
+    with open(DATA_FILE, "a+b") as f:
+        # An interrupted append leaves a last line without its newline;
+        # start a fresh line so the new records are not glued onto it
+        if f.seek(0, os.SEEK_END):
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                payload = b"\n" + payload
+        f.write(payload)
+
+
+def flush_meals(widget):
+    """
+    Queue the buffered meals for appending on the meal worker, watching
+    the write from widget so a failure is reported.
+    """
+    if not _pending_meals:
+        return
+    meals = _pending_meals[:]
+    _pending_meals.clear()
+    call_when_done(widget, meals_pool.submit(append_meals, meals), on_error=show_save_error)
+
+
+def show_save_error(error):
+    """
+    Tell the user a background meal save failed.
+    """
+    messagebox.showerror("Save Failed", f"Could not save meals:\n{error}")
+
+
+# Delay before pending meal entries are written to disk, so bursts coalesce
+FLUSH_DELAY_MS = 500
 
 class NutritionScreen:
     """
@@ -63,20 +144,22 @@ class NutritionScreen:
         ttk.Label(form_frame, text="Carbs (g):").grid(row=3, column=0, padx=5, pady=5, sticky="e")
         ttk.Label(form_frame, text="Fats (g):").grid(row=4, column=0, padx=5, pady=5, sticky="e")
 
-        # Input fields
+        # Input fields; numeric ones only accept digits as they are typed
+        vcmd = digits_only(self.window)
+
         self.meal_type = ttk.Combobox(form_frame, values=["Breakfast", "Lunch", "Dinner", "Snack"], state="readonly")
         self.meal_type.grid(row=0, column=1, padx=5, pady=5)
 
-        self.calories_entry = ttk.Entry(form_frame)
+        self.calories_entry = ttk.Entry(form_frame, validate="key", validatecommand=vcmd)
         self.calories_entry.grid(row=1, column=1, padx=5, pady=5)
 
-        self.protein_entry = ttk.Entry(form_frame)
+        self.protein_entry = ttk.Entry(form_frame, validate="key", validatecommand=vcmd)
         self.protein_entry.grid(row=2, column=1, padx=5, pady=5)
 
-        self.carbs_entry = ttk.Entry(form_frame)
+        self.carbs_entry = ttk.Entry(form_frame, validate="key", validatecommand=vcmd)
         self.carbs_entry.grid(row=3, column=1, padx=5, pady=5)
 
-        self.fats_entry = ttk.Entry(form_frame)
+        self.fats_entry = ttk.Entry(form_frame, validate="key", validatecommand=vcmd)
         self.fats_entry.grid(row=4, column=1, padx=5, pady=5)
 
         # === Buttons ===
@@ -106,29 +189,36 @@ class NutritionScreen:
 
         self.tree.pack(fill=tk.BOTH, expand=True)
 
-        # Load meals from JSON file on start
+        # In-memory meal list; new meals are appended to disk shortly after
+        self._meals = []
+        self._flush_job = None
+        self.window.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.window.bind("<Destroy>", self.on_destroy)
+
+        # Load meals from the JSONL file on start
         self.load_meals()
 
     def log_meal(self):
         """
         Save a meal to JSON file using form data.
         """
-        try:
-            meal = self.meal_type.get()
-            cal = int(self.calories_entry.get())
-            protein = int(self.protein_entry.get())
-            carbs = int(self.carbs_entry.get())
-            fats = int(self.fats_entry.get())
-        except ValueError:
-            messagebox.showerror("Invalid Input", "Please enter only numeric values.")
-            return
+        meal = self.meal_type.get()
+        fields = (self.calories_entry.get(), self.protein_entry.get(),
+                  self.carbs_entry.get(), self.fats_entry.get())
 
         if not meal:
             messagebox.showwarning("Missing Field", "Please select a meal type.")
             return
 
+        # The entries only accept digits, so filled-in fields always parse
+        if not all(fields):
+            messagebox.showwarning("Missing Field", "Please enter calories, protein, carbs and fats.")
+            return
+
+        cal, protein, carbs, fats = map(int, fields)
+
         meal_data = {
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": today_str(),
             "type": meal,
             "calories": cal,
             "protein": protein,
@@ -136,30 +226,86 @@ class NutritionScreen:
             "fats": fats
         }
 
-        with open(DATA_FILE, "r+") as f:
-            data = json.load(f)
-            data.append(meal_data)
-            f.seek(0)
-            json.dump(data, f, indent=4)
-            f.truncate()
+        self._meals.append(meal_data)
+        _pending_meals.append(meal_data)
+        self.tree.insert("", tk.END, values=(
+            meal_data["date"], meal_data["type"], meal_data["calories"],
+            meal_data["protein"], meal_data["carbs"], meal_data["fats"]
+        ))
+        self.schedule_flush()
 
-        messagebox.showinfo("Logged", "Meal has been saved successfully.")
+        show_toast(self.window, "Meal has been saved successfully.")
         self.clear_fields()
-        self.load_meals()
+
+    def schedule_flush(self):
+        """
+        (Re)start the timer that appends pending meals to disk.
+        """
+        if self._flush_job is not None:
+            self.window.after_cancel(self._flush_job)
+        self._flush_job = self.window.after(FLUSH_DELAY_MS, self.flush_to_disk)
+
+    def flush_to_disk(self):
+        """
+        Append the pending meals to the JSONL file in one write.
+        """
+        self._flush_job = None
+        # Watched from the main window, which outlives this one
+        flush_meals(self.window.master)
+
+    def flush_pending(self):
+        """
+        Write pending meals immediately instead of waiting for the timer.
+        """
+        if self._flush_job is not None:
+            self.window.after_cancel(self._flush_job)
+            self.flush_to_disk()
+
+    def on_close(self):
+        """
+        Flush any pending meals before the window is destroyed.
+        """
+        self.flush_pending()
+        self.window.destroy()
+
+    def on_destroy(self, event):
+        """
+        Also flush when the window goes away with the main application.
+        """
+        if event.widget is self.window:
+            self.flush_pending()
 
     def load_meals(self):
         """
-        Load meal data and refresh the table view.
+        Read the meal data in the background, then refresh the table view.
+        """
+        # Meals still buffered by another nutrition window go out first
+        flush_meals(self.window.master)
+        call_when_done(self.window, meals_pool.submit(read_meals), self.populate_table, self.on_load_error)
+
+    def populate_table(self, meals):
+        """
+        Fill the table with the stored meals and any logged since they were read.
         """
-        for row in self.tree.get_children():
-            self.tree.delete(row)
+        # Meals logged while the read was running are not in its result
+        self._meals = meals + self._meals
+        rows = [
+            (m["date"], m["type"], m["calories"], m["protein"], m["carbs"], m["fats"])
+            for m in self._meals
+        ]
+
+        # Unmap the table while repopulating so Tk redraws it only once
+        self.tree.pack_forget()
+        self.tree.delete(*self.tree.get_children())
+        for values in rows:
+            self.tree.insert("", tk.END, values=values)
+        self.tree.pack(fill=tk.BOTH, expand=True)
 
-        with open(DATA_FILE, "r") as f:
-            meals = json.load(f)
-            for m in meals:
-                self.tree.insert("", tk.END, values=(
-                    m["date"], m["type"], m["calories"], m["protein"], m["carbs"], m["fats"]
-                ))
+    def on_load_error(self, error):
+        """
+        Tell the user the meal history could not be read.
+        """
+        messagebox.showerror("Load Failed", f"Could not read meals:\n{error}")
 
     def clear_fields(self):
         """
@@ -175,29 +321,19 @@ class NutritionScreen:
         """
         Show a nutrition tip based on the last meal entry.
         """
-        try:
-            with open(DATA_FILE, "r") as f:
-                data = json.load(f)
-        except:
-            data = []
-
-        if not data:
+        if not self._meals:
             messagebox.showinfo("Tip", "Log a meal to receive personalized nutrition advice.")
             return
 
-        latest = data[-1]
-        tips = []
-
-        if latest["protein"] < 10:
-            tips.append("Add more protein (e.g. eggs, chicken, tofu).")
-        if latest["carbs"] > 100:
-            tips.append("Too many carbs! Reduce sugar and starchy foods.")
-        if latest["fats"] > 40:
-            tips.append("High fat detected. Choose leaner meals.")
-        if latest["calories"] > 700:
-            tips.append("That meal was heavy. Consider balancing with a lighter one.")
+        latest = self._meals[-1]
+        protein, carbs, fats, calories = latest["protein"], latest["carbs"], latest["fats"], latest["calories"]
 
-        if not tips:
-            tips.append("Your meal looks balanced. Keep it up!")
+        rules = [
+            (protein < 10, "Add more protein (e.g. eggs, chicken, tofu)."),
+            (carbs > 100, "Too many carbs! Reduce sugar and starchy foods."),
+            (fats > 40, "High fat detected. Choose leaner meals."),
+            (calories > 700, "That meal was heavy. Consider balancing with a lighter one."),
+        ]
+        tips = [msg for cond, msg in rules if cond] or ["Your meal looks balanced. Keep it up!"]
 
         messagebox.showinfo("Nutrition Tip", "\n\n".join(tips))
@@ -1,25 +1,74 @@
 import tkinter as tk
 from tkinter import ttk
-import json
-import os
-from datetime import datetime, timedelta
-
+from datetime import date
 
 import matplotlib
 matplotlib.use("Agg")  # Use non-interactive backend
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-WORKOUTS_FILE = "data/workouts.json"
-MEALS_FILE = "data/meals.json"
-
-# Ensure data directory and files exist
-for path in [WORKOUTS_FILE, MEALS_FILE]:
-    os.makedirs("data", exist_ok=True)
-    if not os.path.exists(path):
-        with open(path, "w") as f:
-            json.dump([], f)
+from data_store import call_when_done, io_pool
+from nutrition import flush_meals, meals_pool, read_meals
+from workouts import workout_listeners, workout_totals, workouts_version
+
+# Size and line colour of the native fitness chart
+CHART_WIDTH = 550
+CHART_HEIGHT = 240
+CHART_COLOR = "#1f77b4"
+
+# Monospaced so the summary label/value columns line up
+SUMMARY_FONT = ("Courier", 11)
+
+def load_workout_stats():
+    """
+    Aggregate the workout history in the database (runs on the I/O thread).
+
+    Returns a stats dict with the workout count, total calories and
+    duration, the last 7 day labels and the calories burned on each.
+    """
+    today = date.today().toordinal()
+    days = [date.fromordinal(today - i).isoformat() for i in range(6, -1, -1)]
+    count, calories, duration, by_day = workout_totals(days[0])
+    return {"today": today, "count": count, "calories": calories, "duration": duration,
+            "days": days, "weekly": [by_day.get(day, 0) for day in days]}
+
+def add_workout(stats, w):
+    calories = w.get("calories", 0)
+    stats["count"] += 1
+    stats["calories"] += calories
+    stats["duration"] += w.get("duration", 0)
+
+    offset = stats["today"] - date.fromisoformat(w["date"]).toordinal()
+    if 0 <= offset < 7:
+        stats["weekly"][6 - offset] += calories
+
+def average_duration(stats):
+    return round(stats["duration"] / stats["count"], 1) if stats["count"] else 0
+
+def chart_dpi(widget):
+    # Rasterize charts at a lower DPI on standard displays (Tk scaling is
+    # ~1.33 pixels per point at 96 dpi); keep the default on HiDPI screens
+    return 72 if float(widget.tk.call("tk", "scaling")) < 1.5 else 100
+
+def format_summary(rows):
+    # One monospaced label for the whole table instead of two widgets per row
+    return "\n".join(f"{label:<28}{value}" for label, value in rows)
+
+def fitness_summary(stats):
+    return format_summary([
+        ("Total Workouts:", stats["count"]),
+        ("Total Calories Burned:", f"{stats['calories']} kcal")
+    ])
+
+def describe_endurance(avg_duration):
+    if avg_duration >= 40:
+        return "Great improvement in endurance. You're sustaining longer workouts!"
+    elif avg_duration >= 25:
+        return "Moderate endurance improvement detected."
+    elif avg_duration > 0:
+        return "Short sessions logged. Try to increase duration for endurance."
+    return "No workouts yet to analyze."
 
 class ReportScreen:
     def __init__(self, parent):
@@ -39,82 +88,127 @@ class ReportScreen:
         # Always show Fitness Report tab first
         notebook.select(self.fitness_tab)
 
-        self.build_fitness_report()
-        self.build_nutrition_report()
-
-    def build_fitness_report(self):
+        # Read both data files in parallel right away, but build only the
+        # visible tab now; the other one is built the first time it is selected
+        self._workout_future = io_pool.submit(load_workout_stats)
+        self._stats_version = workouts_version()
+        # Meals still buffered by a nutrition window are appended first, on
+        # the same meal worker, so the read sees them
+        flush_meals(parent)
+        self._meals_future = meals_pool.submit(read_meals)
+        self.notebook = notebook
+        self._workout_stats = None
+        self._unseen_workouts = []
+        self._fitness_built = False
+        self._nutrition_built = False
+        notebook.bind("<<NotebookTabChanged>>", self.on_tab_change)
+        self.on_tab_change()
+
+        # Follow workouts logged while the report is open
+        workout_listeners.append(self.on_workout_logged)
+        self.window.bind("<Destroy>", self.on_destroy)
+
+    def on_tab_change(self, event=None):
+        current = self.notebook.index("current")
+        # The tab is built on the Tk thread once its prefetched data arrives
+        if current == 0 and not self._fitness_built:
+            self._fitness_built = True
+            call_when_done(self.window, self._workout_future, self.on_workout_stats,
+                           lambda error: self.show_load_error(self.fitness_tab, error))
+        elif current == 1 and not self._nutrition_built:
+            self._nutrition_built = True
+            call_when_done(self.window, self._meals_future, self.build_nutrition_report,
+                           lambda error: self.show_load_error(self.nutrition_tab, error))
+
+    def show_load_error(self, tab, error):
+        # Say why the tab is empty rather than leaving it blank
+        ttk.Label(tab, text=f"Could not load the report data:\n{error}", justify="center").pack(pady=20)
+
+    def on_workout_stats(self, stats):
+        # Workouts logged after the prefetch was queued are not in its result
+        for workout in self._unseen_workouts:
+            add_workout(stats, workout)
+        self._unseen_workouts = []
+        self._workout_stats = stats
+        self.build_fitness_report(stats)
+
+    def on_workout_logged(self, workout, version):
+        # Queued before the prefetch, so its result already counts it
+        if version <= self._stats_version:
+            return
+
+        # Hold on to it until the prefetched stats arrive
+        if self._workout_stats is None:
+            self._unseen_workouts.append(workout)
+            return
+
+        stats = self._workout_stats
+        add_workout(stats, workout)
+
+        self._fitness_summary.config(text=fitness_summary(stats))
+        self._fitness_analysis.config(text=describe_endurance(average_duration(stats)))
+        self.draw_fitness_chart(stats["days"], stats["weekly"])
+
+    def on_destroy(self, event):
+        if event.widget is self.window and self.on_workout_logged in workout_listeners:
+            workout_listeners.remove(self.on_workout_logged)
+
+    def build_fitness_report(self, stats):
         ttk.Label(self.fitness_tab, text=" Fitness Summary").pack(pady=(0, 10))
 
-        summary_frame = ttk.Frame(self.fitness_tab)
-        summary_frame.pack()
-
-        with open(WORKOUTS_FILE, "r") as f:
-            data = json.load(f)
-            total_workouts = len(data)
-            total_calories = sum(w.get("calories", 0) for w in data)
-            durations = [w.get("duration", 0) for w in data]
-
-        avg_duration = round(sum(durations) / total_workouts, 1) if total_workouts else 0
-
-        labels = [
-            ("Total Workouts:", total_workouts),
-            ("Total Calories Burned:", f"{total_calories} kcal")
-        ]
-
-        for i, (label, value) in enumerate(labels):
-            ttk.Label(summary_frame, text=label, width=25).grid(row=i, column=0, sticky="w", padx=5, pady=3)
-            ttk.Label(summary_frame, text=str(value)).grid(row=i, column=1, sticky="w", padx=5, pady=3)
+        self._fitness_summary = ttk.Label(
+            self.fitness_tab, text=fitness_summary(stats), justify="left", font=SUMMARY_FONT
+        )
+        self._fitness_summary.pack()
 
         ttk.Label(self.fitness_tab, text="\nFitness Performance Analysis:").pack()
 
-        if avg_duration >= 40:
-            summary = "Great improvement in endurance. You're sustaining longer workouts!"
-        elif avg_duration >= 25:
-            summary = "Moderate endurance improvement detected."
-        elif avg_duration > 0:
-            summary = "Short sessions logged. Try to increase duration for endurance."
-        else:
-            summary = "No workouts yet to analyze."
-
-        ttk.Label(self.fitness_tab, text=summary, wraplength=760, justify="center").pack(padx=10, pady=(0, 10))
-
-        self.show_fitness_chart()
-
-    def show_fitness_chart(self):
-        with open(WORKOUTS_FILE, "r") as f:
-            data = json.load(f)
-
-        today = datetime.today()
-        days = [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(6, -1, -1)]
-        calories_by_day = {day: 0 for day in days}
-
-        for w in data:
-            if w["date"] in calories_by_day:
-                calories_by_day[w["date"]] += w.get("calories", 0)
-
-        fig, ax = plt.subplots(figsize=(5.5, 3.2))
-        ax.plot(list(calories_by_day.keys()), list(calories_by_day.values()), marker='o', color='tab:blue')
-        ax.set_title("Calories Burned - Last 7 Days")
-        ax.set_ylabel("Calories")
-        ax.tick_params(axis='x', rotation=45)
-
-        canvas = FigureCanvasTkAgg(fig, master=self.fitness_tab)
-        canvas.draw()
-        canvas.get_tk_widget().pack(pady=5)
-
-    def build_nutrition_report(self):
+        summary = describe_endurance(average_duration(stats))
+        self._fitness_analysis = ttk.Label(self.fitness_tab, text=summary, wraplength=760, justify="center")
+        self._fitness_analysis.pack(padx=10, pady=(0, 10))
+
+        self.show_fitness_chart(stats["days"], stats["weekly"])
+
+    def show_fitness_chart(self, days, weekly):
+        self._fitness_canvas = tk.Canvas(
+            self.fitness_tab, width=CHART_WIDTH, height=CHART_HEIGHT,
+            bg="white", highlightthickness=0
+        )
+        self._fitness_canvas.pack(pady=5)
+        self.draw_fitness_chart(days, weekly)
+
+    def draw_fitness_chart(self, days, weekly):
+        # Seven points don't need matplotlib; draw the line straight onto a Tk canvas
+        canvas = self._fitness_canvas
+        canvas.delete("all")
+
+        left, right, top, bottom = 70, CHART_WIDTH - 30, 35, CHART_HEIGHT - 75
+        peak = max(weekly) or 1
+        step = (right - left) / (len(weekly) - 1)
+        scale = (bottom - top) / peak
+        points = [(left + i * step, bottom - value * scale) for i, value in enumerate(weekly)]
+
+        canvas.create_text(CHART_WIDTH / 2, 15, text="Calories Burned - Last 7 Days", font=("Helvetica", 11, "bold"))
+        canvas.create_text(18, (top + bottom) / 2, text="Calories", angle=90, font=("Helvetica", 9))
+
+        # Axes with min/max labels on the y axis
+        canvas.create_line(left, top, left, bottom, right, bottom, fill="#444444")
+        canvas.create_text(left - 6, bottom, text="0", anchor="e", font=("Helvetica", 8))
+        canvas.create_text(left - 6, top, text=str(max(weekly)), anchor="e", font=("Helvetica", 8))
+
+        canvas.create_line(*[c for point in points for c in point], fill=CHART_COLOR, width=2)
+        for (x, y), day in zip(points, days):
+            canvas.create_oval(x - 3, y - 3, x + 3, y + 3, fill=CHART_COLOR, outline=CHART_COLOR)
+            canvas.create_text(x, bottom + 6, text=day, angle=45, anchor="e", font=("Helvetica", 8))
+
+    def build_nutrition_report(self, data):
         ttk.Label(self.nutrition_tab, text=" Nutrition Summary").pack(pady=(0, 10))
 
-        summary_frame = ttk.Frame(self.nutrition_tab)
-        summary_frame.pack()
-
-        with open(MEALS_FILE, "r") as f:
-            data = json.load(f)
-            meals = len(data)
-            total_protein = sum(m.get("protein", 0) for m in data)
-            total_carbs = sum(m.get("carbs", 0) for m in data)
-            total_fats = sum(m.get("fats", 0) for m in data)
-            total_cals = sum(m.get("calories", 0) for m in data)
+        meals = len(data)
+        total_protein = sum(m.get("protein", 0) for m in data)
+        total_carbs = sum(m.get("carbs", 0) for m in data)
+        total_fats = sum(m.get("fats", 0) for m in data)
+        total_cals = sum(m.get("calories", 0) for m in data)
 
         labels = [
             ("Total Meals:", meals),
@@ -124,14 +218,17 @@ class ReportScreen:
             ("Total Calories Consumed:", f"{total_cals} kcal")
         ]
 
-        for i, (label, value) in enumerate(labels):
-            ttk.Label(summary_frame, text=label, width=25).grid(row=i, column=0, sticky="w", padx=5, pady=3)
-            ttk.Label(summary_frame, text=str(value)).grid(row=i, column=1, sticky="w", padx=5, pady=3)
+        ttk.Label(
+            self.nutrition_tab, text=format_summary(labels), justify="left", font=SUMMARY_FONT
+        ).pack()
 
         self.show_nutrition_pie(total_protein, total_carbs, total_fats)
 
     def show_nutrition_pie(self, protein, carbs, fats):
-        fig, ax = plt.subplots(figsize=(4.2, 2.8))
+        # Each window gets its own figure, sized for the screen it is on
+        fig = Figure(figsize=(4.2, 2.8), dpi=chart_dpi(self.window))
+        ax = fig.add_subplot(111)
+
         labels = ['Protein', 'Carbs', 'Fats']
         values = [protein, carbs, fats]
         colors = ['#4caf50', '#2196f3', '#ff9800']
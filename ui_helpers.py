@@ -0,0 +1,60 @@
+"""
+UI Helpers – Smart Fitness Management System
+
+Small Tk widgets and helpers shared by the screens: self-dismissing
+toasts, a self-clearing status line and a digits-only entry validator.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+# How long save confirmations stay on screen
+TOAST_MS = 800
+
+# How long confirmations stay in a status line
+STATUS_MS = 2000
+
+
+def show_toast(window, message):
+    """
+    Show a brief, non-blocking confirmation over window that dismisses itself.
+    """
+    toast = tk.Toplevel(window)
+    toast.overrideredirect(True)
+    ttk.Label(toast, text=message, padding=8, relief="solid").pack()
+    toast.geometry(f"+{window.winfo_rootx() + 20}+{window.winfo_rooty() + 20}")
+    toast.after(TOAST_MS, toast.destroy)
+
+
+def _is_digits(text):
+    return text == "" or text.isdecimal()
+
+
+def digits_only(widget):
+    """
+    Return a validatecommand that lets an entry accept only digits as they are typed.
+    """
+    return (widget.register(_is_digits), "%P")
+
+
+class StatusLine(ttk.Label):
+    """
+    A label for short confirmations that clear themselves after a moment.
+    """
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, text="", **kwargs)
+        self._job = None
+
+    def flash(self, message, ms=STATUS_MS):
+        """
+        Show a message, replacing any earlier one, and clear it after ms.
+        """
+        if self._job is not None:
+            self.after_cancel(self._job)
+        self.config(text=message)
+        self._job = self.after(ms, self._clear)
+
+    def _clear(self):
+        self._job = None
+        self.config(text="")
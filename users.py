@@ -10,18 +10,28 @@ Main Features:
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import json
-import os
 from tkinter.font import nametofont
+from data_store import call_when_done, ensure_file, io_pool, read_json, write_json
+from ui_helpers import StatusLine
 
 # File where we store user profiles
 data_file = "data/users.json"
 
-# Make sure the data folder and file exist before we try using them
-os.makedirs("data", exist_ok=True)
-if not os.path.exists(data_file):
-    with open(data_file, "w") as f:
-        json.dump([], f)
+# Profiles indexed by lowercased name, read once and shared by every
+# UserScreen so two open windows never overwrite each other's changes
+_users = None
+
+
+def load_users():
+    """
+    Return the shared profile cache, creating the data file on first use.
+    """
+    global _users
+    if _users is None:
+        ensure_file(data_file, [])
+        _users = {u["name"].lower(): u for u in read_json(data_file)}
+    return _users
+
 
 class UserScreen:
     """
@@ -82,6 +92,29 @@ class UserScreen:
         self.profile_display.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         self.profile_display.configure(state="disabled")
 
+        # === Status Line ===
+        self.status = StatusLine(self.window)
+        self.status.pack(anchor="w", padx=20, pady=(0, 10))
+
+        # The file is rewritten whenever a profile changes
+        self._users = load_users()
+
+    def save_users(self):
+        """
+        Write all profiles to the JSON file (via a temp file and atomic
+        rename) on the background writer thread.
+        """
+        future = io_pool.submit(write_json, data_file, list(self._users.values()))
+        # Watched from the main window so a failure is still reported
+        # after this window has been closed
+        call_when_done(self.window.master, future, on_error=self.on_save_error)
+
+    def on_save_error(self, error):
+        """
+        Tell the user a background save failed.
+        """
+        messagebox.showerror("Save Failed", f"Could not save profiles:\n{error}")
+
     def save_user(self):
         """
         Collect form input and save/update it in the JSON file.
@@ -102,15 +135,13 @@ class UserScreen:
 
         user_data = {"name": name, "age": age, "goal": goal}
 
-        with open(data_file, "r+") as file:
-            users = json.load(file)
-            users = [u for u in users if u["name"].lower() != name.lower()]
-            users.append(user_data)
-            file.seek(0)
-            json.dump(users, file, indent=4)
-            file.truncate()
+        # Re-insert so an updated profile moves to the end, as before
+        key = name.lower()
+        self._users.pop(key, None)
+        self._users[key] = user_data
+        self.save_users()
 
-        messagebox.showinfo("Success", "Profile saved.")
+        self.status.flash("Profile saved.")
         self.display_profile(user_data)
 
     def delete_user(self):
@@ -122,17 +153,12 @@ class UserScreen:
             messagebox.showwarning("Input Error", "Enter a name to delete.")
             return
 
-        with open(data_file, "r+") as file:
-            users = json.load(file)
-            new_users = [u for u in users if u["name"].lower() != name.lower()]
-            if len(new_users) == len(users):
-                messagebox.showinfo("Not Found", "No profile found with that name.")
-                return
-            file.seek(0)
-            json.dump(new_users, file, indent=4)
-            file.truncate()
-
-        messagebox.showinfo("Deleted", f"Profile for {name} deleted.")
+        if self._users.pop(name.lower(), None) is None:
+            messagebox.showinfo("Not Found", "No profile found with that name.")
+            return
+        self.save_users()
+
+        self.status.flash(f"Profile for {name} deleted.")
         self.profile_display.config(state="normal")
         self.profile_display.delete(1.0, tk.END)
         self.profile_display.config(state="disabled")
@@ -146,15 +172,13 @@ class UserScreen:
             messagebox.showwarning("Input Error", "Enter a name to load.")
             return
 
-        with open(data_file, "r") as file:
-            users = json.load(file)
-            for u in users:
-                if u["name"].lower() == name.lower():
-                    self.display_profile(u)
-                    self.name.delete(0, tk.END)
-                    self.age.delete(0, tk.END)
-                    self.goal.delete(0, tk.END)
-                    return
+        user = self._users.get(name.lower())
+        if user is not None:
+            self.display_profile(user)
+            self.name.delete(0, tk.END)
+            self.age.delete(0, tk.END)
+            self.goal.delete(0, tk.END)
+            return
 
         messagebox.showwarning("Not Found", "No profile found with that name.")
 
@@ -8,7 +8,8 @@ Users can:
 - Double-click to view notes
 - Delete selected workouts
 
-Data is stored in a local JSON file (data/workouts.json).
+Data is stored in a local SQLite database (data/workouts.db). A history
+kept in the older data/workouts.json file is imported on first use.
 
 Author: Jawad Khan
 Date: [YYYY-MM-DD]
@@ -16,24 +17,184 @@ Date: [YYYY-MM-DD]
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import json
 import os
-from datetime import datetime
+import sqlite3
+from operator import itemgetter
 from tkinter.font import nametofont
+from data_store import call_when_done, io_pool, read_json, today_str
+from ui_helpers import StatusLine, digits_only
 
-DATA_FILE = "data/workouts.json"
+DB_FILE = "data/workouts.db"
+LEGACY_DATA_FILE = "data/workouts.json"
 
-# Ensure data directory and file exist
-os.makedirs("data", exist_ok=True)
-if not os.path.exists(DATA_FILE):
-    with open(DATA_FILE, "w") as f:
-        json.dump([], f)
+# Callbacks notified with each newly logged workout once it is stored,
+# as listener(workout, version) where version is workouts_version() just
+# after its insert was queued (e.g. the goal tracker)
+workout_listeners = []
+
+# Rows fetched into the table at a time; more are fetched while scrolling
+PAGE_SIZE = 200
+
+# Item id of the row shown while the history is still being read
+LOADING_IID = "__loading__"
+
+# Fonts used by the workout window
+_HEADER_FONT = ("Helvetica", 12, "bold")
+_NOTES_FONT = ("Helvetica", 10)
+
+
+# Database connection, opened on first use. Every query runs on the
+# io_pool thread, which is the only thread that ever touches it.
+_conn = None
+
+# Bumped whenever a change to the workouts is queued, so other screens
+# can tell whether totals they computed earlier are still current
+_version = 0
+
+
+def _db():
+    """
+    Return the database connection, creating the table (and importing the
+    old JSON history) the first time. Runs on the I/O thread.
+    """
+    global _conn
+    if _conn is None:
+        os.makedirs(os.path.dirname(DB_FILE), exist_ok=True)
+        conn = sqlite3.connect(DB_FILE)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS workouts ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, date TEXT, type TEXT, "
+            "duration INTEGER, calories INTEGER, notes TEXT)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS workouts_date ON workouts (date)")
+
+        # One-time migration from the old JSON file. It is only imported into
+        # an empty table, and only set aside (never deleted) once the import
+        # has committed; a JSON file next to a populated table is left alone.
+        if (os.path.exists(LEGACY_DATA_FILE)
+                and conn.execute("SELECT 1 FROM workouts LIMIT 1").fetchone() is None):
+            with conn:
+                conn.executemany(
+                    "INSERT INTO workouts (date, type, duration, calories, notes) VALUES (?, ?, ?, ?, ?)",
+                    ((w["date"], w["type"], w["duration"], w["calories"], w.get("notes"))
+                     for w in read_json(LEGACY_DATA_FILE))
+                )
+            os.replace(LEGACY_DATA_FILE, LEGACY_DATA_FILE + ".bak")
+        _conn = conn
+    return _conn
+
+
+def insert_workout(workout):
+    """
+    Store one workout and return its id.
+    """
+    with _db() as conn:
+        cur = conn.execute(
+            "INSERT INTO workouts (date, type, duration, calories, notes) VALUES (?, ?, ?, ?, ?)",
+            (workout["date"], workout["type"], workout["duration"], workout["calories"], workout["notes"])
+        )
+    return cur.lastrowid
+
+
+def delete_workout(workout_id):
+    """
+    Delete one workout by id; an id that is already gone is ignored.
+    """
+    with _db() as conn:
+        conn.execute("DELETE FROM workouts WHERE id = ?", (workout_id,))
+
+
+def delete_all_workouts():
+    """
+    Delete every workout.
+    """
+    with _db() as conn:
+        conn.execute("DELETE FROM workouts")
+
+
+def read_page(before_id=None):
+    """
+    Return up to PAGE_SIZE (id, date, type, duration, calories) rows,
+    newest first, starting below before_id when given.
+    """
+    if before_id is None:
+        return _db().execute(
+            "SELECT id, date, type, duration, calories FROM workouts ORDER BY id DESC LIMIT ?",
+            (PAGE_SIZE,)
+        ).fetchall()
+    return _db().execute(
+        "SELECT id, date, type, duration, calories FROM workouts WHERE id < ? ORDER BY id DESC LIMIT ?",
+        (before_id, PAGE_SIZE)
+    ).fetchall()
+
+
+def read_notes(workout_id):
+    """
+    Return a workout's notes, or None if it has none or is gone.
+    """
+    row = _db().execute("SELECT notes FROM workouts WHERE id = ?", (workout_id,)).fetchone()
+    return None if row is None else row[0]
+
+
+def daily_calories():
+    """
+    Return {date: calories burned} over the whole history.
+    """
+    return dict(_db().execute("SELECT date, SUM(calories) FROM workouts GROUP BY date"))
+
+
+def workout_totals(since):
+    """
+    Return the workout count, total calories and total duration, plus
+    {date: calories burned} for dates on or after since.
+    """
+    conn = _db()
+    count, calories, duration = conn.execute(
+        "SELECT COUNT(*), COALESCE(SUM(calories), 0), COALESCE(SUM(duration), 0) FROM workouts"
+    ).fetchone()
+    by_day = dict(conn.execute(
+        "SELECT date, SUM(calories) FROM workouts WHERE date >= ? GROUP BY date", (since,)
+    ))
+    return count, calories, duration, by_day
+
+
+def submit_change(func, *args):
+    """
+    Queue a function that changes the workouts on the I/O thread.
+    Call this from the Tk thread only.
+    """
+    global _version
+    _version += 1
+    return io_pool.submit(func, *args)
+
+
+def workouts_version():
+    """
+    Return a number that changes whenever a change to the workouts is queued.
+    """
+    return _version
+
+
+def clear_workouts():
+    """
+    Queue emptying the workout history and return its future.
+    """
+    return submit_change(delete_all_workouts)
+
+
+# Table cells for a newly logged workout dict, in a single C-level call
+row_values = itemgetter("date", "type", "duration", "calories")
 
 class WorkoutScreen:
     """
     A GUI window for logging, viewing, and deleting workout records.
     """
 
+    # The default font is global Tk state, so it only needs setting once
+    _font_configured = False
+
     def __init__(self, parent):
         self.window = tk.Toplevel(parent)
         self.window.title("Workout Tracking")
@@ -41,23 +202,27 @@ class WorkoutScreen:
         self.window.resizable(False, False)
 
         # Set default font
-        default_font = nametofont("TkDefaultFont")
-        default_font.configure(family="Helvetica", size=11)
+        if not WorkoutScreen._font_configured:
+            nametofont("TkDefaultFont").configure(family="Helvetica", size=11)
+            WorkoutScreen._font_configured = True
 
         # === Workout Input Form ===
         form_frame = ttk.Frame(self.window, padding=10)
         form_frame.pack(fill=tk.X)
 
+        # Duration and calories only accept digits as they are typed
+        vcmd = digits_only(self.window)
+
         ttk.Label(form_frame, text="Exercise Type:").grid(row=0, column=0, sticky="e", padx=5, pady=5)
         self.exercise_entry = ttk.Entry(form_frame, width=30)
         self.exercise_entry.grid(row=0, column=1, padx=5, pady=5)
 
         ttk.Label(form_frame, text="Duration (mins):").grid(row=1, column=0, sticky="e", padx=5, pady=5)
-        self.duration_entry = ttk.Entry(form_frame, width=30)
+        self.duration_entry = ttk.Entry(form_frame, width=30, validate="key", validatecommand=vcmd)
         self.duration_entry.grid(row=1, column=1, padx=5, pady=5)
 
         ttk.Label(form_frame, text="Calories Burned:").grid(row=2, column=0, sticky="e", padx=5, pady=5)
-        self.calories_entry = ttk.Entry(form_frame, width=30)
+        self.calories_entry = ttk.Entry(form_frame, width=30, validate="key", validatecommand=vcmd)
         self.calories_entry.grid(row=2, column=1, padx=5, pady=5)
 
         ttk.Label(form_frame, text="Notes:").grid(row=3, column=0, sticky="ne", padx=5, pady=5)
@@ -65,7 +230,7 @@ class WorkoutScreen:
             form_frame,
             width=30,
             height=4,
-            font=("Helvetica", 10),
+            font=_NOTES_FONT,
             relief="solid",
             borderwidth=1,
             padx=5,
@@ -73,13 +238,14 @@ class WorkoutScreen:
         )
         self.notes_text.grid(row=3, column=1, padx=5, pady=5)
 
-        ttk.Button(form_frame, text="Log Workout", command=self.log_workout).grid(row=4, column=1, sticky="e", pady=10)
+        self.log_button = ttk.Button(form_frame, text="Log Workout", command=self.log_workout)
+        self.log_button.grid(row=4, column=1, sticky="e", pady=10)
 
         # === Workout History Table ===
         table_frame = ttk.Frame(self.window, padding=(10, 0))
         table_frame.pack(fill=tk.BOTH, expand=True)
 
-        ttk.Label(table_frame, text="Workout History", font=("Helvetica", 12, "bold")).pack(anchor="w", pady=(0, 5))
+        ttk.Label(table_frame, text="Workout History", font=_HEADER_FONT).pack(anchor="w", pady=(0, 5))
 
         self.tree = ttk.Treeview(
             table_frame,
@@ -91,6 +257,15 @@ class WorkoutScreen:
             self.tree.heading(col, text=col)
             self.tree.column(col, width=130)
 
+        # Only a page of history (newest first) is in the table at first;
+        # scrolling near the bottom fetches the next, older page
+        self._oldest_id = None
+        self._more = False
+        self._page_pending = False
+        self.scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.on_tree_scroll)
+
+        self.scrollbar.pack(side="right", fill="y", pady=5)
         self.tree.pack(fill=tk.BOTH, expand=True, pady=5)
         self.tree.bind("<Double-1>", self.on_row_double_click)
 
@@ -99,7 +274,14 @@ class WorkoutScreen:
         button_bottom.pack(pady=10)
         ttk.Button(button_bottom, text="Delete Selected", command=self.delete_selected).pack()
 
-        # Load workouts into the table
+        # === Status Line ===
+        self.status = StatusLine(self.window)
+        self.status.pack(anchor="w", padx=15, pady=(0, 10))
+
+        # Load workouts into the table; logging waits for the first page
+        # and a placeholder row shows the table is not just empty
+        self.log_button.state(["disabled"])
+        self.tree.insert("", tk.END, iid=LOADING_IID, values=("Loading…", "", "", ""))
         self.load_workouts()
 
     def log_workout(self):
@@ -115,92 +297,176 @@ class WorkoutScreen:
             messagebox.showwarning("Input Error", "Please fill all fields.")
             return
 
-        try:
-            duration = int(duration)
-            calories = int(calories)
-        except ValueError:
-            messagebox.showerror("Invalid Input", "Duration and Calories must be numbers.")
-            return
+        # The entries only accept digits, so filled-in fields always parse
+        duration = int(duration)
+        calories = int(calories)
 
         workout = {
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": today_str(),
             "type": exercise,
             "duration": duration,
             "calories": calories,
             "notes": notes
         }
 
-        with open(DATA_FILE, "r+") as f:
-            data = json.load(f)
-            data.append(workout)
-            f.seek(0)
-            json.dump(data, f, indent=4)
-            f.truncate()
+        future = submit_change(insert_workout, workout)
+        version = workouts_version()
 
-        messagebox.showinfo("Success", "Workout logged.")
-        self.clear_fields()
-        self.load_workouts()
+        # The form keeps its input until the insert is known to have worked;
+        # logging is paused meanwhile so the same workout isn't sent twice
+        self.log_button.state(["disabled"])
+        # Listeners hear about the workout and the row goes in once the
+        # database has stored it and assigned its id. Watched from the main
+        # window so listeners are still told if this window is closed first.
+        call_when_done(self.window.master, future,
+                       lambda workout_id: self.on_workout_saved(workout_id, workout, version),
+                       self.on_log_error)
+
+    def on_workout_saved(self, workout_id, workout, version):
+        """
+        Tell the listeners about a stored workout, add it to the table and
+        confirm it in the status line.
+        """
+        for listener in list(workout_listeners):
+            listener(workout, version)
+
+        if self.window.winfo_exists():
+            self.insert_row(workout_id, workout)
+            self.log_button.state(["!disabled"])
+            self.status.flash("Workout logged.")
+            self.clear_fields()
+
+    def on_log_error(self, error):
+        """
+        Report a failed insert, leaving the form filled in for another try.
+        """
+        if self.window.winfo_exists():
+            self.log_button.state(["!disabled"])
+        self.on_save_error(error)
 
     def load_workouts(self):
         """
-        Load workouts from JSON file and populate the Treeview.
+        Fetch the newest page of workouts in the background, then populate the Treeview.
+        """
+        call_when_done(self.window, io_pool.submit(read_page), self.populate_table, self.on_load_error)
+
+    def on_save_error(self, error):
+        """
+        Tell the user a background save failed.
+        """
+        messagebox.showerror("Save Failed", f"Could not save workouts:\n{error}")
+
+    def on_load_error(self, error):
+        """
+        Tell the user the history could not be read and let them log anyway.
+        """
+        if self.tree.exists(LOADING_IID):
+            self.tree.delete(LOADING_IID)
+        self.log_button.state(["!disabled"])
+        messagebox.showerror("Load Failed", f"Could not load workouts:\n{error}")
+
+    def on_page_error(self, error):
+        """
+        Stop paging after a page of older workouts failed to load.
+        """
+        # Further scrolling would only fail again, so stop asking for pages
+        self._page_pending = False
+        self._more = False
+        messagebox.showerror("Load Failed", f"Could not load older workouts:\n{error}")
+
+    def populate_table(self, rows):
+        """
+        Fill the Treeview with the first page of workouts.
+        """
+        # Unmap the table while repopulating so Tk lays it out only once
+        self.tree.pack_forget()
+        try:
+            self.tree.delete(*self.tree.get_children())  # Clear table first
+            self.add_page(rows)
+        finally:
+            self.tree.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.log_button.state(["!disabled"])
+
+    def add_page(self, rows):
+        """
+        Append a page of (id, date, type, duration, calories) rows to the
+        end of the Treeview, using each workout's id as its item id.
+        """
+        insert = self.tree.insert
+        for row in rows:
+            insert("", "end", iid=row[0], values=row[1:])
+
+        self._more = len(rows) == PAGE_SIZE
+        if rows:
+            self._oldest_id = rows[-1][0]
+
+    def on_tree_scroll(self, first, last):
+        """
+        Keep the scrollbar in step and fetch older rows as the end comes into view.
         """
-        self.tree.delete(*self.tree.get_children())  # Clear table first
+        self.scrollbar.set(first, last)
+        if self._more and not self._page_pending and float(last) > 0.9:
+            self._page_pending = True
+            call_when_done(self.window, io_pool.submit(read_page, self._oldest_id), self.on_next_page,
+                           self.on_page_error)
 
-        with open(DATA_FILE, "r") as f:
-            data = json.load(f)
-            for workout in data:
-                self.tree.insert("", tk.END, values=(
-                    workout["date"],
-                    workout["type"],
-                    workout["duration"],
-                    workout["calories"]
-                ))
+    def on_next_page(self, rows):
+        """
+        Add a page fetched while scrolling.
+        """
+        self._page_pending = False
+        # Unmapping would lose the scroll position, so hide the columns
+        # instead while the page goes in; Tk then lays the rows out once
+        self.tree.configure(displaycolumns=())
+        try:
+            self.add_page(rows)
+        finally:
+            self.tree.configure(displaycolumns="#all")
+
+    def insert_row(self, workout_id, workout):
+        """
+        Put a newly logged workout at the top of the Treeview, using its
+        id as the item id.
+        """
+        self.tree.insert("", 0, iid=workout_id, values=row_values(workout))
 
     def delete_selected(self):
         """
-        Delete selected workout from table and file.
+        Delete selected workout from table and database.
         """
         selected = self.tree.selection()
         if not selected:
             messagebox.showwarning("Select", "Select a workout to delete.")
             return
+        if selected[0] == LOADING_IID:
+            return
 
-        values = self.tree.item(selected[0], "values")
-        date, wtype, duration, _ = values
-
-        with open(DATA_FILE, "r+") as f:
-            data = json.load(f)
-            data = [w for w in data if not (
-                w["date"] == date and
-                w["type"] == wtype and
-                str(w["duration"]) == duration
-            )]
-            f.seek(0)
-            json.dump(data, f, indent=4)
-            f.truncate()
-
-        messagebox.showinfo("Deleted", "Workout deleted.")
-        self.load_workouts()
+        # The row's item id is the workout's id. Ids are never reused, so it
+        # may already be gone from the database (if the history was reset or
+        # it was deleted in another window) but never names another workout
+        iid = selected[0]
+        self.tree.delete(iid)
+        future = submit_change(delete_workout, int(iid))
+        # Watch from the parent so a failure is reported even if the window closes
+        call_when_done(self.window.master, future, on_error=self.on_save_error)
+
+        self.status.flash("Workout deleted.")
 
     def on_row_double_click(self, event):
         """
         Show workout notes in a messagebox on double-click.
         """
         selected = self.tree.selection()
-        if not selected:
+        if not selected or selected[0] == LOADING_IID:
             return
 
-        values = self.tree.item(selected[0], "values")
-        date, wtype, duration, _ = values
+        call_when_done(self.window, io_pool.submit(read_notes, int(selected[0])), self.show_notes)
 
-        with open(DATA_FILE, "r") as f:
-            data = json.load(f)
-            for w in data:
-                if (w["date"], w["type"], str(w["duration"])) == (date, wtype, str(duration)):
-                    notes = w.get("notes", "No notes available.")
-                    messagebox.showinfo("Workout Notes", notes)
-                    return
+    def show_notes(self, notes):
+        """
+        Display the notes fetched for a double-clicked row.
+        """
+        messagebox.showinfo("Workout Notes", "No notes available." if notes is None else notes)
 
     def clear_fields(self):
         """